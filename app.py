@@ -92,6 +92,18 @@ def add_security_headers(response):
     return response
 
 
+@app.after_request
+def disable_sse_buffering(response):
+    """Keep proxies and compression layers from holding back SSE frames."""
+    if response.mimetype == 'text/event-stream':
+        response.headers.setdefault('Cache-Control', 'no-cache, no-transform')
+        response.headers.setdefault('X-Accel-Buffering', 'no')
+        # Routes set their own Cache-Control; no-transform still has to reach
+        # intermediaries so they do not buffer frames to compress them.
+        response.cache_control.no_transform = True
+    return response
+
+
 # ============================================
 # CONTEXT PROCESSORS
 # ============================================
@@ -99,12 +111,15 @@ def add_security_headers(response):
 @app.context_processor
 def inject_offline_settings():
     """Inject offline settings into all templates."""
-    from utils.database import get_setting
+    from routes.offline import get_offline_settings
+
+    # Runs on every template render, so read all keys in one query.
+    settings = get_offline_settings()
 
     # Privacy-first defaults: keep dashboard assets/fonts local to avoid
     # third-party tracker/storage defenses in strict browsers.
-    assets_source = str(get_setting('offline.assets_source', 'local') or 'local').lower()
-    fonts_source = str(get_setting('offline.fonts_source', 'local') or 'local').lower()
+    assets_source = str(settings['offline.assets_source'] or 'local').lower()
+    fonts_source = str(settings['offline.fonts_source'] or 'local').lower()
     if assets_source not in ('local', 'cdn'):
         assets_source = 'local'
     if fonts_source not in ('local', 'cdn'):
@@ -115,11 +130,11 @@ def inject_offline_settings():
 
     return {
         'offline_settings': {
-            'enabled': get_setting('offline.enabled', False),
+            'enabled': settings['offline.enabled'],
             'assets_source': assets_source,
             'fonts_source': fonts_source,
-            'tile_provider': get_setting('offline.tile_provider', 'cartodb_dark_cyan'),
-            'tile_server_url': get_setting('offline.tile_server_url', '')
+            'tile_provider': settings['offline.tile_provider'],
+            'tile_server_url': settings['offline.tile_server_url']
         }
     }
 
@@ -335,6 +350,34 @@ def require_login():
     if 'logged_in' not in session and request.endpoint not in allowed_routes:
         return redirect(url_for('login'))
     
+
+# Largest JSON body accepted by any API route. Checked against Content-Length
+# before the body is read, or capped while reading for chunked bodies, so
+# oversized posts never reach the JSON parser.
+# File uploads are multipart and are not affected.
+MAX_JSON_BODY_BYTES = 4 * 1024 * 1024
+
+
+@app.before_request
+def reject_oversized_json():
+    if not request.is_json:
+        return None
+    content_length = request.content_length
+    if content_length is None:
+        # Chunked bodies carry no Content-Length. Have Werkzeug stop reading one
+        # byte past the cap, and cache what was read for the view's get_json().
+        request.max_content_length = MAX_JSON_BODY_BYTES + 1
+        content_length = len(request.get_data(cache=True))
+    if content_length > MAX_JSON_BODY_BYTES:
+        return jsonify({'status': 'error', 'message': 'Request body too large'}), 413
+    return None
+
+
+@app.errorhandler(413)
+def request_entity_too_large(e):
+    return jsonify({'status': 'error', 'message': 'Request body too large'}), 413
+
+
 @app.route('/logout')
 def logout():
     session.pop('logged_in', None)
@@ -734,16 +777,36 @@ def _get_wifi_health() -> tuple[bool, int, int]:
     )
 
 
+# Every open dashboard tab and any external monitor polls /health; reuse a
+# short-lived snapshot instead of probing every scanner on each request.
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple[float, dict] | None = None
+
+
 @app.route('/health')
 def health_check() -> Response:
     """Health check endpoint for monitoring."""
-    import time
+    global _health_cache
+
+    now = _time.monotonic()
+    cached = _health_cache
+    if cached is None or now >= cached[0]:
+        cached = (now + _HEALTH_CACHE_TTL_SECONDS, _build_health_payload())
+        _health_cache = cached
+
+    response = jsonify(cached[1])
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def _build_health_payload() -> dict:
+    """Collect process and data counts for the health endpoint."""
     bt_active, bt_device_count = _get_bluetooth_health()
     wifi_active, wifi_network_count, wifi_client_count = _get_wifi_health()
-    return jsonify({
+    return {
         'status': 'healthy',
         'version': VERSION,
-        'uptime_seconds': round(time.time() - _app_start_time, 2),
+        'uptime_seconds': round(_time.time() - _app_start_time, 2),
         'processes': {
             'pager': current_process is not None and (current_process.poll() is None if current_process else False),
             'sensor': sensor_process is not None and (sensor_process.poll() is None if sensor_process else False),
@@ -765,7 +828,7 @@ def health_check() -> Response:
             'bt_devices_count': bt_device_count,
             'dsc_messages_count': len(dsc_messages),
         }
-    })
+    }
 
 
 @app.route('/killall', methods=['POST'])
@@ -7,6 +7,8 @@ for counter-surveillance operations.
 
 from __future__ import annotations
 
+import re
+
 # =============================================================================
 # Known Surveillance Frequencies (MHz)
 # =============================================================================
@@ -328,6 +330,12 @@ WIFI_CAMERA_PATTERNS = {
     },
 }
 
+# One alternation over all SSID substrings so a lookup is a single scan
+_CAMERA_SSID_RE = re.compile('|'.join(re.escape(p) for p in WIFI_CAMERA_PATTERNS['ssid_patterns']))
+
+# Camera vendor names folded to lowercase once for substring checks
+_CAMERA_VENDORS_LOWER = tuple(m.lower() for m in WIFI_CAMERA_PATTERNS['oui_manufacturers'])
+
 
 # =============================================================================
 # Utility Functions
@@ -403,11 +411,8 @@ def is_known_tracker(device_name: str | None, manufacturer_data: bytes | str | N
 
 def is_potential_camera(ssid: str | None = None, mac: str | None = None, vendor: str | None = None) -> bool:
     """Check if a WiFi device might be a hidden camera."""
-    if ssid:
-        ssid_lower = ssid.lower()
-        for pattern in WIFI_CAMERA_PATTERNS['ssid_patterns']:
-            if pattern in ssid_lower:
-                return True
+    if ssid and _CAMERA_SSID_RE.search(ssid.lower()):
+        return True
 
     if mac:
         mac_prefix = mac[:8].upper()
@@ -416,8 +421,8 @@ def is_potential_camera(ssid: str | None = None, mac: str | None = None, vendor:
 
     if vendor:
         vendor_lower = vendor.lower()
-        for manufacturer in WIFI_CAMERA_PATTERNS['oui_manufacturers']:
-            if manufacturer.lower() in vendor_lower:
+        for manufacturer in _CAMERA_VENDORS_LOWER:
+            if manufacturer in vendor_lower:
                 return True
 
     return False
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import os
-import queue
 import shutil
 import socket
 import subprocess
@@ -43,7 +42,7 @@ from utils.validation import (
     validate_device_index, validate_gain,
     validate_rtl_tcp_host, validate_rtl_tcp_port
 )
-from utils.sse import format_sse
+from utils.sse import FanoutSubscriberSet, format_sse
 from utils.event_pipeline import process_event
 from utils.sdr import SDRFactory, SDRType
 from utils.constants import (
@@ -77,10 +76,9 @@ _sbs_error_logged = False  # Suppress repeated connection error logs
 # Track ICAOs already looked up in aircraft database (avoid repeated lookups)
 _looked_up_icaos: set[str] = set()
 
-# Per-client SSE queues for ADS-B stream fanout.
-_adsb_stream_subscribers: set[queue.Queue] = set()
-_adsb_stream_subscribers_lock = threading.Lock()
+# Per-client SSE buffers for ADS-B stream fanout.
 _ADSB_STREAM_CLIENT_QUEUE_SIZE = 500
+_adsb_stream = FanoutSubscriberSet(_ADSB_STREAM_CLIENT_QUEUE_SIZE)
 
 # Load aircraft database at module init
 aircraft_db.load_database()
@@ -210,27 +208,12 @@ def _parse_int_param(value: str | None, default: int, min_value: int | None = No
 
 def _broadcast_adsb_update(payload: dict[str, Any]) -> None:
     """Fan out a payload to all active ADS-B SSE subscribers."""
-    with _adsb_stream_subscribers_lock:
-        subscribers = tuple(_adsb_stream_subscribers)
-
-    for subscriber in subscribers:
-        try:
-            subscriber.put_nowait(payload)
-        except queue.Full:
-            # Drop oldest queued event for that client and try once more.
-            try:
-                subscriber.get_nowait()
-                subscriber.put_nowait(payload)
-            except (queue.Empty, queue.Full):
-                # Client queue remains saturated; skip this payload.
-                continue
+    _adsb_stream.publish(payload)
 
 
 def _adsb_stream_queue_depth() -> int:
     """Best-effort aggregate queue depth across connected ADS-B SSE clients."""
-    with _adsb_stream_subscribers_lock:
-        subscribers = tuple(_adsb_stream_subscribers)
-    return sum(subscriber.qsize() for subscriber in subscribers)
+    return _adsb_stream.pending()
 
 
 def _get_active_session() -> dict[str, Any] | None:
@@ -645,7 +628,7 @@ def adsb_status():
         'lines_received': adsb_lines_received,
         'last_message_time': adsb_last_message_time,
         'aircraft_count': len(app_module.adsb_aircraft),
-        'aircraft': dict(app_module.adsb_aircraft),  # Full aircraft data
+        'aircraft': app_module.adsb_aircraft.all(),  # Full aircraft data
         'queue_size': _adsb_stream_queue_depth(),
         'dump1090_path': find_dump1090(),
         'dump1090_running': dump1090_running,
@@ -937,39 +920,35 @@ def stop_adsb():
 @adsb_bp.route('/stream')
 def stream_adsb():
     """SSE stream for ADS-B aircraft."""
-    client_queue: queue.Queue = queue.Queue(maxsize=_ADSB_STREAM_CLIENT_QUEUE_SIZE)
-    with _adsb_stream_subscribers_lock:
-        _adsb_stream_subscribers.add(client_queue)
+    subscriber = _adsb_stream.subscribe()
 
     # Prime new clients with current known aircraft so they don't wait for the
     # next positional update before rendering.
     for snapshot in list(app_module.adsb_aircraft.values()):
-        try:
-            client_queue.put_nowait({'type': 'aircraft', **snapshot})
-        except queue.Full:
+        if subscriber.is_full():
             break
+        subscriber.push({'type': 'aircraft', **snapshot})
 
     def generate():
-        last_keepalive = time.time()
+        last_keepalive = time.monotonic()
 
         try:
             while True:
-                try:
-                    msg = client_queue.get(timeout=SSE_QUEUE_TIMEOUT)
-                    last_keepalive = time.time()
-                    try:
-                        process_event('adsb', msg, msg.get('type'))
-                    except Exception:
-                        pass
-                    yield format_sse(msg)
-                except queue.Empty:
-                    now = time.time()
+                if subscriber.wait(timeout=SSE_QUEUE_TIMEOUT):
+                    for msg in subscriber.drain():
+                        try:
+                            process_event('adsb', msg, msg.get('type'))
+                        except Exception:
+                            pass
+                        yield format_sse(msg)
+                    last_keepalive = time.monotonic()
+                else:
+                    now = time.monotonic()
                     if now - last_keepalive >= SSE_KEEPALIVE_INTERVAL:
                         yield format_sse({'type': 'keepalive'})
                         last_keepalive = now
         finally:
-            with _adsb_stream_subscribers_lock:
-                _adsb_stream_subscribers.discard(client_queue)
+            _adsb_stream.unsubscribe(subscriber)
 
     response = Response(generate(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache'
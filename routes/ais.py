@@ -340,7 +340,7 @@ def ais_status():
         'messages_received': ais_messages_received,
         'last_message_time': ais_last_message_time,
         'vessel_count': len(app_module.ais_vessels),
-        'vessels': dict(app_module.ais_vessels),
+        'vessels': app_module.ais_vessels.all(),
         'queue_size': app_module.ais_queue.qsize(),
         'ais_catcher_path': find_ais_catcher(),
         'process_running': process_running
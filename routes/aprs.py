@@ -64,6 +64,11 @@ _last_meter_level = -1
 METER_MIN_INTERVAL = 0.1  # Max 10 updates/sec
 METER_MIN_CHANGE = 2  # Only send if level changes by at least this much
 
+# Patterns applied to every decoder output line
+_DECODER_TAG_PREFIX_RE = re.compile(r'^(?:\[[^\]]+\]\s*)+', re.ASCII)
+_PACKET_HEADER_RE = re.compile(r'^([A-Z0-9/\-]+)>([^:]+):(.+)$', re.IGNORECASE | re.ASCII)
+_AUDIO_LEVEL_RE = re.compile(r'Audio level\s*=\s*(\d+)', re.IGNORECASE | re.ASCII)
+
 
 def find_direwolf() -> Optional[str]:
     """Find direwolf binary."""
@@ -125,7 +130,7 @@ def normalize_aprs_output_line(line: str) -> str:
 
     # Strip one or more leading bracket tags emitted by decoders.
     # Examples: [0.4], [0L], [NONE]
-    normalized = re.sub(r'^(?:\[[^\]]+\]\s*)+', '', normalized)
+    normalized = _DECODER_TAG_PREFIX_RE.sub('', normalized)
     return normalized
 
 
@@ -153,7 +158,7 @@ def parse_aprs_packet(raw_packet: str) -> Optional[dict]:
         # Example: N0CALL-9>APRS,TCPIP*:@092345z4903.50N/07201.75W_090/000g005t077
 
         # Source callsigns can include tactical suffixes like "/1" on some stations.
-        match = re.match(r'^([A-Z0-9/\-]+)>([^:]+):(.+)$', raw_packet, re.IGNORECASE)
+        match = _PACKET_HEADER_RE.match(raw_packet)
         if not match:
             return None
 
@@ -1364,7 +1369,7 @@ def parse_audio_level(line: str) -> Optional[int]:
     We normalize it to 0-100 scale (direwolf typically outputs 0-100+).
     """
     # Match "Audio level = NN" pattern
-    match = re.search(r'Audio level\s*=\s*(\d+)', line, re.IGNORECASE)
+    match = _AUDIO_LEVEL_RE.search(line)
     if match:
         raw_level = int(match.group(1))
         # Normalize: direwolf levels are typically 0-100, but can go higher
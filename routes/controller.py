@@ -12,8 +12,6 @@ from __future__ import annotations
 
 import json
 import logging
-import queue
-import threading
 import time
 from datetime import datetime, timezone
 from typing import Generator
@@ -29,7 +27,7 @@ from utils.database import (
 from utils.agent_client import (
     AgentClient, AgentHTTPError, AgentConnectionError, create_client_from_agent
 )
-from utils.sse import format_sse
+from utils.sse import FanoutSubscriberSet, format_sse
 from utils.trilateration import (
     DeviceLocationTracker, PathLossModel, Trilateration,
     AgentObservation, estimate_location_from_observations
@@ -39,26 +37,21 @@ logger = logging.getLogger('intercept.controller')
 
 controller_bp = Blueprint('controller', __name__, url_prefix='/controller')
 
-# Multi-agent SSE fanout state (per-client queues).
-_agent_stream_subscribers: set[queue.Queue] = set()
-_agent_stream_subscribers_lock = threading.Lock()
+# Multi-agent SSE fanout state; client buffers hold pre-formatted SSE frames.
 _AGENT_STREAM_CLIENT_QUEUE_SIZE = 500
+_agent_stream = FanoutSubscriberSet(_AGENT_STREAM_CLIENT_QUEUE_SIZE)
+
+# Query-string values accepted as "true" for boolean flags.
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))
 
 
 def _broadcast_agent_data(payload: dict) -> None:
     """Fan out an ingested payload to all active /controller/stream/all clients."""
-    with _agent_stream_subscribers_lock:
-        subscribers = tuple(_agent_stream_subscribers)
+    if not _agent_stream.snapshot:
+        return
 
-    for subscriber in subscribers:
-        try:
-            subscriber.put_nowait(payload)
-        except queue.Full:
-            try:
-                subscriber.get_nowait()
-                subscriber.put_nowait(payload)
-            except (queue.Empty, queue.Full):
-                continue
+    # Encode once and share the frame string across every client buffer
+    _agent_stream.publish(format_sse(payload))
 
 
 # =============================================================================
@@ -68,11 +61,11 @@ def _broadcast_agent_data(payload: dict) -> None:
 @controller_bp.route('/agents', methods=['GET'])
 def get_agents():
     """List all registered agents."""
-    active_only = request.args.get('active_only', 'true').lower() == 'true'
+    active_only = request.args.get('active_only', 'true').lower() in _TRUTHY
     agents = list_agents(active_only=active_only)
 
     # Optionally refresh status for each agent
-    refresh = request.args.get('refresh', 'false').lower() == 'true'
+    refresh = request.args.get('refresh', '').lower() in _TRUTHY
     if refresh:
         for agent in agents:
             try:
@@ -182,7 +175,7 @@ def get_agent_detail(agent_id: int):
         return jsonify({'status': 'error', 'message': 'Agent not found'}), 404
 
     # Optionally refresh from agent
-    refresh = request.args.get('refresh', 'false').lower() == 'true'
+    refresh = request.args.get('refresh', '').lower() in _TRUTHY
     if refresh:
         try:
             client = create_client_from_agent(agent)
@@ -697,28 +690,24 @@ def stream_all_agents():
     This endpoint streams push data as it arrives from agents.
     Each message is tagged with agent_id and agent_name.
     """
-    client_queue: queue.Queue = queue.Queue(maxsize=_AGENT_STREAM_CLIENT_QUEUE_SIZE)
-    with _agent_stream_subscribers_lock:
-        _agent_stream_subscribers.add(client_queue)
+    subscriber = _agent_stream.subscribe()
 
     def generate() -> Generator[str, None, None]:
-        last_keepalive = time.time()
+        last_keepalive = time.monotonic()
         keepalive_interval = 30.0
 
         try:
             while True:
-                try:
-                    msg = client_queue.get(timeout=1.0)
-                    last_keepalive = time.time()
-                    yield format_sse(msg)
-                except queue.Empty:
-                    now = time.time()
+                if subscriber.wait(timeout=1.0):
+                    yield from subscriber.drain()
+                    last_keepalive = time.monotonic()
+                else:
+                    now = time.monotonic()
                     if now - last_keepalive >= keepalive_interval:
                         yield format_sse({'type': 'keepalive'})
                         last_keepalive = now
         finally:
-            with _agent_stream_subscribers_lock:
-                _agent_stream_subscribers.discard(client_queue)
+            _agent_stream.unsubscribe(subscriber)
 
     response = Response(generate(), mimetype='text/event-stream')
     response.headers['Cache-Control'] = 'no-cache'
@@ -26,10 +26,10 @@ def get_device_correlations() -> Response:
     include_historical = request.args.get('include_historical', 'true').lower() == 'true'
 
     try:
-        # Get current device data
-        wifi_devices = dict(app_module.wifi_networks)
-        wifi_devices.update(dict(app_module.wifi_clients))
-        bt_devices = dict(app_module.bt_devices)
+        # Snapshot current device data (one locked copy per store)
+        wifi_devices = app_module.wifi_networks.all()
+        wifi_devices.update(app_module.wifi_clients.all())
+        bt_devices = app_module.bt_devices.all()
 
         # Calculate correlations
         correlations = get_correlations(
@@ -3,7 +3,7 @@ Offline mode routes - Asset management and settings for offline operation.
 """
 
 from flask import Blueprint, jsonify, request
-from utils.database import get_setting, set_setting
+from utils.database import get_setting, get_settings as db_get_settings, set_setting
 import os
 
 offline_bp = Blueprint('offline', __name__, url_prefix='/offline')
@@ -54,10 +54,7 @@ ASSET_PATHS = {
 
 def get_offline_settings():
     """Get all offline settings with defaults."""
-    settings = {}
-    for key, default in OFFLINE_DEFAULTS.items():
-        settings[key] = get_setting(key, default)
-    return settings
+    return db_get_settings(OFFLINE_DEFAULTS)
 
 
 @offline_bp.route('/settings', methods=['GET'])
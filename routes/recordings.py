@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, Response, jsonify, request, send_file
 
 from utils.recording import get_recording_manager, RECORDING_ROOT
 
@@ -20,7 +20,9 @@ def start_recording():
         return jsonify({'status': 'error', 'message': 'mode is required'}), 400
 
     label = data.get('label')
-    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    metadata = data.get('metadata')
+    if not isinstance(metadata, dict):
+        metadata = {}
 
     manager = get_recording_manager()
     session = manager.start_recording(mode=mode, label=label, metadata=metadata)
@@ -133,24 +135,7 @@ def get_recording_events(session_id: str):
     limit = max(1, min(5000, request.args.get('limit', default=500, type=int)))
     offset = max(0, request.args.get('offset', default=0, type=int))
 
-    events: list[dict] = []
-    seen = 0
-    with file_path.open('r', encoding='utf-8', errors='replace') as fh:
-        for idx, line in enumerate(fh):
-            if idx < offset:
-                continue
-            if seen >= limit:
-                break
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                events.append(json.loads(line))
-                seen += 1
-            except json.JSONDecodeError:
-                continue
-
-    return jsonify({
+    header = json.dumps({
         'status': 'success',
         'recording': {
             'id': rec['id'],
@@ -161,6 +146,28 @@ def get_recording_events(session_id: str):
         },
         'offset': offset,
         'limit': limit,
-        'returned': len(events),
-        'events': events,
     })
+
+    def _generate():
+        # Stream the stored JSON lines as-is instead of building the whole
+        # event list in memory and re-encoding it.
+        yield header[:-1] + ', "events": ['
+        seen = 0
+        with file_path.open('r', encoding='utf-8', errors='replace') as fh:
+            for idx, line in enumerate(fh):
+                if idx < offset:
+                    continue
+                if seen >= limit:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                yield line if seen == 0 else ',' + line
+                seen += 1
+        yield f'], "returned": {seen}}}'
+
+    return Response(_generate(), mimetype='application/json')
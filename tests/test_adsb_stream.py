@@ -0,0 +1,44 @@
+"""Tests for the ADS-B SSE stream."""
+
+import json
+from itertools import islice
+from unittest.mock import patch
+
+from routes import adsb
+from utils.sse import FanoutSubscriberSet
+
+
+class TestAdsbStreamPriming:
+    """Tests for seeding new /adsb/stream clients with known aircraft."""
+
+    def test_new_client_primed_with_aircraft_up_to_buffer_size(self, client):
+        """A new client should start with current aircraft, capped at its buffer size."""
+        aircraft = {f'A0000{i}': {'icao': f'A0000{i}', 'altitude': 1000 * i} for i in range(5)}
+        stream = FanoutSubscriberSet(client_buffer_size=3)
+
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+
+        with patch.object(adsb, '_adsb_stream', stream), \
+                patch.object(adsb.app_module, 'adsb_aircraft', aircraft):
+            response = client.get('/adsb/stream')
+            try:
+                assert response.status_code == 200
+                assert len(stream.snapshot) == 1
+                subscriber = stream.snapshot[0]
+
+                frames = [
+                    json.loads(chunk.decode()[len('data: '):])
+                    for chunk in islice(response.response, 3)
+                ]
+                assert frames == [
+                    {'type': 'aircraft', 'icao': 'A00000', 'altitude': 0},
+                    {'type': 'aircraft', 'icao': 'A00001', 'altitude': 1000},
+                    {'type': 'aircraft', 'icao': 'A00002', 'altitude': 2000},
+                ]
+                # Priming stopped at the buffer size instead of evicting the first aircraft
+                assert not subscriber.frames
+            finally:
+                response.close()
+
+        assert not stream.snapshot
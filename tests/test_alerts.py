@@ -0,0 +1,47 @@
+"""Tests for alert rule matching."""
+
+from utils.alerts import AlertManager, AlertRule, _compile_match, _index_rules_by_mode
+
+
+class TestRuleMatching:
+    """Tests for AlertManager rule matching against events."""
+
+    def test_compile_match_splits_dotted_keys(self):
+        compiled = _compile_match({'ssid': 'Cam', 'target.rssi': {'op': 'gt', 'value': -60}})
+
+        assert compiled == (
+            (('ssid',), 'Cam'),
+            (('target', 'rssi'), {'op': 'gt', 'value': -60}),
+        )
+
+    def test_match_rule_uses_nested_paths(self):
+        manager = AlertManager()
+        compiled = _compile_match({'ssid': 'cam', 'target.rssi': {'op': 'gt', 'value': -60}})
+
+        assert manager._match_rule(compiled, {'ssid': 'CAM', 'target': {'rssi': -40}})
+        assert not manager._match_rule(compiled, {'ssid': 'CAM', 'target': {'rssi': -80}})
+        assert not manager._match_rule(compiled, {'ssid': 'CAM', 'target': 'not-a-dict'})
+
+    def test_empty_match_accepts_any_event(self):
+        assert AlertManager()._match_rule(_compile_match({}), {'anything': 1})
+
+
+class TestRuleIndex:
+    """Tests for per-mode rule bucketing."""
+
+    @staticmethod
+    def _rule(rule_id, mode):
+        return AlertRule(
+            id=rule_id, name=f'rule-{rule_id}', mode=mode, event_type=None,
+            match={}, severity='medium', enabled=True, notify={},
+        )
+
+    def test_mode_less_rules_apply_to_every_mode(self):
+        rules = [self._rule(1, 'wifi'), self._rule(2, None), self._rule(3, 'bluetooth'), self._rule(4, 'wifi')]
+
+        by_mode, any_mode = _index_rules_by_mode(rules)
+
+        assert [r.id for r in by_mode['wifi']] == [1, 2, 4]
+        assert [r.id for r in by_mode['bluetooth']] == [2, 3]
+        assert [r.id for r in any_mode] == [2]
+        assert 'adsb' not in by_mode
@@ -205,6 +205,18 @@ class TestDeviceAggregator:
         device = aggregator.get_all_devices()[0]
         assert device.protocol == "classic"
 
+    def test_tracker_detection_skipped_for_unchanged_advertisement(self, aggregator, sample_observation):
+        """Repeat advertisements with unchanged scored fields reuse the last tracker result."""
+        engine = aggregator._tracker_engine
+        with patch.object(engine, 'detect_tracker', wraps=engine.detect_tracker) as detect:
+            aggregator.ingest(sample_observation)
+            aggregator.ingest(sample_observation)
+            assert detect.call_count == 1
+
+            sample_observation.name = "Renamed Device"
+            aggregator.ingest(sample_observation)
+            assert detect.call_count == 2
+
 
 class TestRangeBandEstimation:
     """Tests for range band estimation."""
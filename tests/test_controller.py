@@ -181,6 +181,40 @@ class TestAgentCRUD:
         assert data['agent']['name'] == 'test-sensor'
         assert data['agent']['capabilities']['adsb'] is True
 
+    def test_list_agents_active_only_flag(self, client, sample_agent):
+        """active_only should accept 0/off as false and default to true."""
+        from utils.database import update_agent
+        update_agent(sample_agent, is_active=False)
+
+        for query, expected in (('', 0), ('?active_only=0', 1), ('?active_only=off', 1), ('?active_only=yes', 0)):
+            response = client.get(f'/controller/agents{query}')
+            assert response.status_code == 200
+            assert json.loads(response.data)['count'] == expected, query
+
+    def test_list_agents_refresh_flag(self, client, sample_agent):
+        """refresh=1 should health-check each agent; refresh=no should not."""
+        with patch('routes.controller.create_client_from_agent') as mock_create:
+            mock_create.return_value.health_check.return_value = True
+
+            response = client.get('/controller/agents?refresh=no')
+            assert 'healthy' not in json.loads(response.data)['agents'][0]
+            mock_create.assert_not_called()
+
+            response = client.get('/controller/agents?refresh=1')
+            assert json.loads(response.data)['agents'][0]['healthy'] is True
+            mock_create.return_value.health_check.assert_called_once()
+
+    def test_get_agent_detail_refresh_flag(self, client, sample_agent):
+        """refresh=yes on agent detail should refresh metadata from the agent."""
+        with patch('routes.controller.create_client_from_agent') as mock_create:
+            mock_create.return_value.refresh_metadata.return_value = {'healthy': False}
+
+            response = client.get(f'/controller/agents/{sample_agent}?refresh=yes')
+
+        assert response.status_code == 200
+        assert json.loads(response.data)['agent']['healthy'] is False
+        mock_create.return_value.refresh_metadata.assert_called_once()
+
     def test_get_agent_not_found(self, client):
         """GET /controller/agents/<id> should return 404 for missing agent."""
         response = client.get('/controller/agents/99999')
@@ -567,3 +601,19 @@ class TestSSEStream:
         # Full SSE testing requires more complex setup
         response = client.get('/controller/stream/all')
         assert response.content_type == 'text/event-stream'
+
+    def test_broadcast_drops_oldest_frame_when_client_buffer_full(self):
+        """A slow client should keep the newest frames rather than block ingest."""
+        from routes import controller
+
+        subscriber = controller._agent_stream.subscribe()
+        try:
+            for i in range(controller._AGENT_STREAM_CLIENT_QUEUE_SIZE + 1):
+                controller._broadcast_agent_data({'seq': i})
+        finally:
+            controller._agent_stream.unsubscribe(subscriber)
+
+        assert subscriber not in controller._agent_stream.snapshot
+        assert subscriber.ready.is_set()
+        assert len(subscriber.frames) == controller._AGENT_STREAM_CLIENT_QUEUE_SIZE
+        assert subscriber.frames[0] == controller.format_sse({'seq': 1})
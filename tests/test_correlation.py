@@ -187,6 +187,23 @@ class TestDeviceCorrelator:
             # Should be sorted by confidence (highest first)
             assert correlations[0]['confidence'] >= correlations[1]['confidence']
 
+    def test_correlate_parses_each_device_once(self):
+        """Test each device is converted once, not once per pair."""
+        from utils.correlation import DeviceCorrelator
+
+        correlator = DeviceCorrelator(min_confidence=0.0)
+        now = datetime.now()
+
+        wifi_devices = {f'AA:BB:CC:00:00:{i:02X}': {'first_seen': now, 'last_seen': now} for i in range(3)}
+        bt_devices = {f'11:22:33:00:00:{i:02X}': {'first_seen': now, 'last_seen': now} for i in range(4)}
+
+        with patch.object(correlator, '_to_observation', wraps=correlator._to_observation) as to_obs, \
+                patch('utils.correlation.add_correlations'):
+            correlations = correlator.correlate(wifi_devices, bt_devices)
+
+        assert to_obs.call_count == len(wifi_devices) + len(bt_devices)
+        assert len(correlations) == len(wifi_devices) * len(bt_devices)
+
 
 class TestGetCorrelations:
     """Tests for get_correlations function."""
@@ -133,6 +133,29 @@ class TestSettingsCRUD:
         assert all_settings['key2'] == 42
         assert all_settings['key3'] is True
 
+    def test_get_settings_batch(self, temp_db):
+        """Test reading several settings at once with per-key defaults."""
+        from utils.database import get_settings, set_setting
+
+        set_setting('batch.name', 'value1')
+        set_setting('batch.count', 42)
+        set_setting('batch.flag', False)
+
+        settings = get_settings({
+            'batch.name': 'x',
+            'batch.count': 0,
+            'batch.flag': True,
+            'batch.missing': 'fallback',
+        })
+
+        assert settings == {
+            'batch.name': 'value1',
+            'batch.count': 42,
+            'batch.flag': False,
+            'batch.missing': 'fallback',
+        }
+        assert get_settings({}) == {}
+
 
 class TestSignalHistory:
     """Tests for signal history operations."""
@@ -254,3 +277,19 @@ class TestDeviceCorrelations:
                    if c['wifi_mac'] == 'AA:AA:AA:AA:AA:AA']
         assert len(matching) == 1
         assert matching[0]['confidence'] == 0.9
+
+    def test_add_correlations_batch(self, temp_db):
+        """Test adding several correlations in one call."""
+        from utils.database import add_correlations, get_correlations
+
+        add_correlations([
+            {'wifi_mac': 'AA:AA:AA:AA:AA:AA', 'bt_mac': 'BB:BB:BB:BB:BB:BB', 'confidence': 0.8,
+             'metadata': {'wifi_name': 'phone'}},
+            {'wifi_mac': 'CC:CC:CC:CC:CC:CC', 'bt_mac': 'DD:DD:DD:DD:DD:DD', 'confidence': 0.75},
+        ])
+
+        correlations = {c['wifi_mac']: c for c in get_correlations(min_confidence=0.0)}
+
+        assert set(correlations) == {'AA:AA:AA:AA:AA:AA', 'CC:CC:CC:CC:CC:CC'}
+        assert correlations['AA:AA:AA:AA:AA:AA']['metadata'] == {'wifi_name': 'phone'}
+        assert correlations['CC:CC:CC:CC:CC:CC']['metadata'] is None
@@ -0,0 +1,76 @@
+"""Tests for session recording API endpoints."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """Write a recording file with blank and malformed lines mixed in."""
+    lines = [
+        json.dumps({'seq': 0}),
+        '',
+        json.dumps({'seq': 1}),
+        'not json',
+        json.dumps({'seq': 2}),
+        '   ',
+        json.dumps({'seq': 3}),
+    ]
+    file_path = tmp_path / 'session.jsonl'
+    file_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    rec = {
+        'id': 'rec-1',
+        'mode': 'adsb',
+        'started_at': '2026-01-01T00:00:00',
+        'stopped_at': '2026-01-01T00:10:00',
+        'event_count': 4,
+        'file_path': str(file_path),
+    }
+    manager = MagicMock()
+    manager.get_recording.return_value = rec
+
+    with patch('routes.recordings.get_recording_manager', return_value=manager), \
+            patch('routes.recordings.RECORDING_ROOT', tmp_path):
+        yield rec
+
+
+class TestRecordingEvents:
+    """Tests for the streamed /recordings/<id>/events response."""
+
+    @staticmethod
+    def _get_events(client, query=''):
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+        response = client.get(f'/recordings/rec-1/events{query}')
+        assert response.status_code == 200
+        return json.loads(response.get_data(as_text=True))
+
+    def test_events_skip_blank_and_malformed_lines(self, client, recording):
+        """Body should be valid JSON holding only the parseable events."""
+        data = self._get_events(client)
+
+        assert data['status'] == 'success'
+        assert data['recording']['id'] == 'rec-1'
+        assert data['events'] == [{'seq': 0}, {'seq': 1}, {'seq': 2}, {'seq': 3}]
+        assert data['returned'] == 4
+        assert data['offset'] == 0
+        assert data['limit'] == 500
+
+    def test_events_limit_and_offset(self, client, recording):
+        """Offset skips raw file lines and limit caps the returned events."""
+        data = self._get_events(client, '?offset=2&limit=2')
+
+        assert data['events'] == [{'seq': 1}, {'seq': 2}]
+        assert data['returned'] == 2
+        assert data['offset'] == 2
+        assert data['limit'] == 2
+
+    def test_events_offset_past_end(self, client, recording):
+        """An offset beyond the file should still produce a well-formed empty list."""
+        data = self._get_events(client, '?offset=100')
+
+        assert data['events'] == []
+        assert data['returned'] == 0
@@ -58,6 +58,87 @@ class TestHealthEndpoint:
         assert 'wifi' in processes
         assert 'bluetooth' in processes
 
+    def test_health_not_modified(self, client):
+        """Test health endpoint honours If-None-Match while cached."""
+        response = client.get('/health')
+        etag = response.headers.get('ETag')
+        assert etag
+
+        response = client.get('/health', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+
+
+class TestRequestBodyLimit:
+    """Tests for the JSON request body cap."""
+
+    def test_oversized_json_rejected(self, client):
+        """Test JSON bodies over the cap are refused before parsing."""
+        from app import MAX_JSON_BODY_BYTES
+
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+
+        body = '{"pad": "' + 'x' * MAX_JSON_BODY_BYTES + '"}'
+        response = client.post('/satellite/tracked', data=body, content_type='application/json')
+
+        assert response.status_code == 413
+        assert json.loads(response.data)['status'] == 'error'
+
+    def test_oversized_chunked_json_rejected(self, client):
+        """Test JSON bodies without a Content-Length are capped while read."""
+        import io
+
+        from app import MAX_JSON_BODY_BYTES
+
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+
+        body = ('{"pad": "' + 'x' * MAX_JSON_BODY_BYTES + '"}').encode()
+        response = client.post(
+            '/satellite/tracked',
+            input_stream=io.BytesIO(body),
+            content_type='application/json',
+            headers={'Transfer-Encoding': 'chunked'},
+            environ_overrides={'wsgi.input_terminated': True, 'CONTENT_LENGTH': ''},
+        )
+
+        assert response.status_code == 413
+        assert json.loads(response.data)['status'] == 'error'
+
+
+class TestSSEResponseHeaders:
+    """Tests for the anti-buffering headers added to SSE responses."""
+
+    def test_sse_endpoint_headers(self, client):
+        """Test SSE endpoints opt out of proxy buffering and transforms."""
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+
+        response = client.get('/alerts/stream')
+        try:
+            assert response.status_code == 200
+            assert response.mimetype == 'text/event-stream'
+            assert response.headers['X-Accel-Buffering'] == 'no'
+            assert response.cache_control.no_cache
+            assert response.cache_control.no_transform
+            assert 'Content-Encoding' not in response.headers
+        finally:
+            response.close()
+
+    def test_sse_defaults_fill_missing_headers(self, app):
+        """Test the hook fills in headers a route did not set."""
+        from flask import Response
+
+        from app import disable_sse_buffering
+
+        with app.test_request_context():
+            response = disable_sse_buffering(Response('', mimetype='text/event-stream'))
+
+        assert response.headers['Cache-Control'] == 'no-cache, no-transform'
+        assert response.headers['X-Accel-Buffering'] == 'no'
+
+
 class TestDevicesEndpoint:
     """Tests for devices endpoint."""
 
@@ -189,6 +270,24 @@ class TestSettingsEndpoints:
         assert data['deleted'] is True
 
 
+class TestOfflineSettingsEndpoints:
+    """Tests for offline mode settings endpoints."""
+
+    def test_get_offline_settings(self, client):
+        """Test offline settings are returned with every default key."""
+        from routes.offline import OFFLINE_DEFAULTS
+
+        with client.session_transaction() as sess:
+            sess['logged_in'] = True
+
+        response = client.get('/offline/settings')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['status'] == 'success'
+        assert set(data['settings']) == set(OFFLINE_DEFAULTS)
+
+
 class TestCorrelationEndpoints:
     """Tests for correlation API endpoints."""
 
@@ -6,7 +6,7 @@ import queue
 import time
 import uuid
 
-from utils.sse import subscribe_fanout_queue
+from utils.sse import FanoutSubscriberSet, format_sse, subscribe_fanout_queue
 
 
 def _channel_key(prefix: str) -> str:
@@ -50,3 +50,28 @@ def test_fanout_delivers_buffered_message_after_re_subscribe() -> None:
         unsubscribe2()
 
     assert got == expected
+
+
+def test_format_sse_frames() -> None:
+    """Frames should match the SSE wire format with and without an event name."""
+    assert format_sse({"type": "keepalive"}) == 'data: {"type": "keepalive"}\n\n'
+    assert format_sse("ping", event="status") == "event: status\ndata: ping\n\n"
+
+
+def test_fanout_subscriber_set_publishes_to_snapshot() -> None:
+    """Published frames should reach current subscribers and wake them once drained."""
+    subscribers = FanoutSubscriberSet(client_buffer_size=2)
+    first = subscribers.subscribe()
+    second = subscribers.subscribe()
+    subscribers.unsubscribe(second)
+
+    for frame in ("a", "b", "c"):
+        subscribers.publish(frame)
+
+    assert subscribers.snapshot == (first,)
+    assert subscribers.pending() == 2
+    assert first.is_full()
+    assert first.wait(timeout=0)
+    assert list(first.drain()) == ["b", "c"]
+    assert not first.wait(timeout=0)
+    assert not second.frames
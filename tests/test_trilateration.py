@@ -0,0 +1,67 @@
+"""Tests for RSSI multilateration."""
+
+import pytest
+
+from utils.trilateration import (
+    NUMPY_AVAILABLE,
+    AgentObservation,
+    PathLossModel,
+    Trilateration,
+    haversine_distance,
+)
+
+TRUE_POSITION = (40.7130, -74.0056)
+ANCHORS = [
+    ('node-1', 40.7128, -74.0060),
+    ('node-2', 40.7140, -74.0050),
+    ('node-3', 40.7120, -74.0045),
+    ('node-4', 40.7135, -74.0070),
+]
+
+
+def _observations(model):
+    """Build noise-free observations of TRUE_POSITION from every anchor."""
+    return [
+        AgentObservation(
+            agent_name=name,
+            agent_lat=lat,
+            agent_lon=lon,
+            rssi=model.distance_to_rssi(haversine_distance(*TRUE_POSITION, lat, lon)),
+        )
+        for name, lat, lon in ANCHORS
+    ]
+
+
+class TestTrilateration:
+    """Tests for Trilateration.estimate_location."""
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_least_squares_seed_recovers_position(self):
+        """Closed-form seed should land on the true position for exact ranges."""
+        model = PathLossModel('outdoor')
+        obs = _observations(model)
+        distances = [model.rssi_to_distance(o.rssi) for o in obs]
+
+        seed = Trilateration._least_squares_seed(obs, distances)
+
+        assert seed is not None
+        assert haversine_distance(*seed, *TRUE_POSITION) < 1.0
+
+    @pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+    def test_least_squares_seed_rejects_collinear_observers(self):
+        """Observers on a single line cannot fix a 2D position."""
+        obs = [
+            AgentObservation(agent_name=f'node-{i}', agent_lat=40.7120 + i * 0.0005, agent_lon=-74.0050, rssi=-60)
+            for i in range(3)
+        ]
+
+        assert Trilateration._least_squares_seed(obs, [50.0, 40.0, 30.0]) is None
+
+    def test_estimate_location_close_to_true_position(self):
+        """Full estimate should converge near the transmitter."""
+        model = PathLossModel('outdoor')
+        estimate = Trilateration(model).estimate_location(_observations(model))
+
+        assert estimate is not None
+        assert estimate.num_observations == len(ANCHORS)
+        assert haversine_distance(estimate.latitude, estimate.longitude, *TRUE_POSITION) < 25.0
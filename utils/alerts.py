@@ -29,12 +29,17 @@ class AlertRule:
     enabled: bool
     notify: dict
     created_at: str | None = None
+    # (key path parts, expected) pairs pre-split from ``match`` at load time
+    match_paths: tuple[tuple[tuple[str, ...], Any], ...] = ()
 
 
 class AlertManager:
     def __init__(self) -> None:
         self._queue: queue.Queue = queue.Queue(maxsize=1000)
-        self._rules_cache: list[AlertRule] = []
+        # Enabled rules that apply to each mode (mode-specific plus mode-less),
+        # with mode-less rules alone serving any mode that has no rule of its own
+        self._rules_by_mode: dict[str, tuple[AlertRule, ...]] = {}
+        self._any_mode_rules: tuple[AlertRule, ...] = ()
         self._rules_loaded_at = 0.0
         self._cache_lock = threading.Lock()
 
@@ -76,18 +81,24 @@ class AlertManager:
                     enabled=bool(row['enabled']),
                     notify=notify,
                     created_at=row['created_at'],
+                    match_paths=_compile_match(match),
                 ))
+        rules_by_mode, any_mode_rules = _index_rules_by_mode(rules)
         with self._cache_lock:
-            self._rules_cache = rules
+            self._rules_by_mode = rules_by_mode
+            self._any_mode_rules = any_mode_rules
             self._rules_loaded_at = time.time()
 
-    def _get_rules(self) -> list[AlertRule]:
+    def _refresh_rules_if_stale(self) -> None:
         with self._cache_lock:
             stale = (time.time() - self._rules_loaded_at) > 10
         if stale:
             self._load_rules()
+
+    def _get_rules_for_mode(self, mode: str) -> tuple[AlertRule, ...]:
+        self._refresh_rules_if_stale()
         with self._cache_lock:
-            return list(self._rules_cache)
+            return self._rules_by_mode.get(mode, self._any_mode_rules)
 
     def list_rules(self, include_disabled: bool = False) -> list[dict]:
         with get_db() as conn:
@@ -221,18 +232,16 @@ class AlertManager:
         if event_type in ('keepalive', 'ping', 'status'):
             return
 
-        rules = self._get_rules()
+        rules = self._get_rules_for_mode(mode)
         if not rules:
             return
 
         for rule in rules:
-            if rule.mode and rule.mode != mode:
-                continue
             if rule.event_type and event_type and rule.event_type != event_type:
                 continue
             if rule.event_type and not event_type:
                 continue
-            if not self._match_rule(rule.match, event):
+            if not self._match_rule(rule.match_paths, event):
                 continue
 
             title = rule.name or 'Alert'
@@ -342,21 +351,18 @@ class AlertManager:
     # Matching
     # ------------------------------------------------------------------
 
-    def _match_rule(self, rule_match: dict, event: dict) -> bool:
-        if not rule_match:
-            return True
-
-        for key, expected in rule_match.items():
-            actual = self._extract_value(event, key)
+    def _match_rule(self, match_paths: tuple, event: dict) -> bool:
+        for path, expected in match_paths:
+            actual = self._extract_value(event, path)
             if not self._match_value(actual, expected):
                 return False
         return True
 
-    def _extract_value(self, event: dict, key: str) -> Any:
-        if '.' not in key:
-            return event.get(key)
+    def _extract_value(self, event: dict, path: tuple[str, ...]) -> Any:
+        if len(path) == 1:
+            return event.get(path[0])
         current: Any = event
-        for part in key.split('.'):
+        for part in path:
             if isinstance(current, dict):
                 current = current.get(part)
             else:
@@ -430,10 +436,30 @@ _alert_lock = threading.Lock()
 
 def get_alert_manager() -> AlertManager:
     global _alert_manager
-    with _alert_lock:
-        if _alert_manager is None:
-            _alert_manager = AlertManager()
-        return _alert_manager
+    if _alert_manager is None:
+        with _alert_lock:
+            if _alert_manager is None:
+                _alert_manager = AlertManager()
+    return _alert_manager
+
+
+def _index_rules_by_mode(
+    rules: list[AlertRule],
+) -> tuple[dict[str, tuple[AlertRule, ...]], tuple[AlertRule, ...]]:
+    """Bucket rules by mode, keeping id order; mode-less rules join every bucket."""
+    any_mode_rules = tuple(rule for rule in rules if not rule.mode)
+    rules_by_mode = {
+        mode: tuple(rule for rule in rules if not rule.mode or rule.mode == mode)
+        for mode in {rule.mode for rule in rules if rule.mode}
+    }
+    return rules_by_mode, any_mode_rules
+
+
+def _compile_match(match: dict) -> tuple[tuple[tuple[str, ...], Any], ...]:
+    """Split dotted match keys once so per-event matching only walks tuples."""
+    if not isinstance(match, dict):
+        return ()
+    return tuple((tuple(str(key).split('.')), expected) for key, expected in match.items())
 
 
 def _safe_number(value: Any) -> float | None:
@@ -74,6 +74,9 @@ class DeviceAggregator:
         # Fingerprint mapping for cross-MAC tracking
         self._fingerprint_to_devices: dict[str, set[str]] = {}
 
+        # Tracker detection inputs last scored per device (device_id -> inputs)
+        self._tracker_inputs: dict[str, tuple] = {}
+
     def ingest(self, observation: BTObservation) -> BTDeviceAggregate:
         """
         Ingest a new observation and update the device aggregate.
@@ -321,25 +324,36 @@ class DeviceAggregator:
         for uuid, data in service_data.items():
             device.service_data[uuid] = data
 
-        # Run tracker detection
-        result = self._tracker_engine.detect_tracker(
-            address=device.address,
-            address_type=device.address_type,
-            name=device.name,
-            manufacturer_id=device.manufacturer_id,
-            manufacturer_data=device.manufacturer_bytes,
-            service_uuids=device.service_uuids,
-            service_data=service_data,
-            tx_power=device.tx_power,
+        # Run tracker detection, skipping repeat advertisements whose scored
+        # fields are unchanged since the last run for this device
+        tracker_inputs = (
+            device.address,
+            device.address_type,
+            device.name,
+            device.manufacturer_id,
+            device.manufacturer_bytes,
+            tuple(device.service_uuids),
         )
+        if self._tracker_inputs.get(device.device_id) != tracker_inputs:
+            result = self._tracker_engine.detect_tracker(
+                address=device.address,
+                address_type=device.address_type,
+                name=device.name,
+                manufacturer_id=device.manufacturer_id,
+                manufacturer_data=device.manufacturer_bytes,
+                service_uuids=device.service_uuids,
+                service_data=service_data,
+                tx_power=device.tx_power,
+            )
 
-        # Update device with detection results
-        device.is_tracker = result.is_tracker
-        device.tracker_type = result.tracker_type.value if result.tracker_type else None
-        device.tracker_name = result.tracker_name
-        device.tracker_confidence = result.confidence.value if result.confidence else None
-        device.tracker_confidence_score = result.confidence_score
-        device.tracker_evidence = result.evidence
+            # Update device with detection results
+            device.is_tracker = result.is_tracker
+            device.tracker_type = result.tracker_type.value if result.tracker_type else None
+            device.tracker_name = result.tracker_name
+            device.tracker_confidence = result.confidence.value if result.confidence else None
+            device.tracker_confidence_score = result.confidence_score
+            device.tracker_evidence = result.evidence
+            self._tracker_inputs[device.device_id] = tracker_inputs
 
         # Generate and store payload fingerprint
         fingerprint = self._tracker_engine.generate_device_fingerprint(
@@ -447,12 +461,14 @@ class DeviceAggregator:
             ]
             for device_id in stale_ids:
                 del self._devices[device_id]
+                self._tracker_inputs.pop(device_id, None)
             return len(stale_ids)
 
     def clear(self) -> None:
         """Clear all tracked devices."""
         with self._lock:
             self._devices.clear()
+            self._tracker_inputs.clear()
 
     def set_baseline(self) -> int:
         """
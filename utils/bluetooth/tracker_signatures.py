@@ -505,7 +505,7 @@ class TrackerSignatureEngine:
         name: Optional[str],
         manufacturer_id: Optional[int],
         manufacturer_data: Optional[bytes],
-        normalized_uuids: list[str],
+        normalized_uuids: frozenset[str],
         service_data: dict[str, bytes],
     ) -> tuple[float, list[str]]:
         """Score how well a device matches a tracker signature."""
@@ -594,7 +594,7 @@ class TrackerSignatureEngine:
         address_type: str,
         manufacturer_id: Optional[int],
         manufacturer_data: Optional[bytes],
-        normalized_uuids: list[str],
+        normalized_uuids: frozenset[str],
     ) -> tuple[float, list[str]]:
         """Check for generic tracker-like indicators."""
         score = 0.0
@@ -635,19 +635,23 @@ class TrackerSignatureEngine:
 
         return score, evidence
 
-    def _normalize_service_uuids(self, uuids: list[str]) -> list[str]:
-        """Normalize service UUIDs to lowercase, extracting 16-bit UUIDs where possible."""
-        normalized = []
+    def _normalize_service_uuids(self, uuids: list[str]) -> frozenset[str]:
+        """
+        Normalize service UUIDs to lowercase, extracting 16-bit UUIDs where possible.
+
+        Returned as a set since every signature probes it for membership.
+        """
+        normalized = set()
         for uuid in uuids:
             uuid_lower = uuid.lower()
             # Extract 16-bit UUID from full 128-bit Bluetooth Base UUID
             # Format: 0000XXXX-0000-1000-8000-00805f9b34fb
             if len(uuid_lower) == 36 and uuid_lower.endswith('-0000-1000-8000-00805f9b34fb'):
                 short_uuid = uuid_lower[4:8]
-                normalized.append(short_uuid)
+                normalized.add(short_uuid)
             else:
-                normalized.append(uuid_lower)
-        return normalized
+                normalized.add(uuid_lower)
+        return frozenset(normalized)
 
     def generate_device_fingerprint(
         self,
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import queue
+import re
 import threading
 import time
 from dataclasses import dataclass, field
@@ -32,12 +33,19 @@ POLL_INTERVAL_SECONDS = 1.5
 SCAN_RESTART_BACKOFF_SECONDS = 8.0
 NO_MATCH_LOG_EVERY_POLLS = 10
 
+# Canonical colon-separated uppercase MAC, as reported by the scanner
+_CANONICAL_MAC_RE = re.compile(r'[0-9A-F]{2}(?::[0-9A-F]{2}){5}')
+
 
 def _normalize_mac(address: str | None) -> str | None:
     """Normalize MAC string to colon-separated uppercase form when possible."""
     if not address:
         return None
 
+    # Fast path: scanner addresses are almost always already canonical
+    if isinstance(address, str) and _CANONICAL_MAC_RE.fullmatch(address):
+        return address
+
     text = str(address).strip().upper().replace('-', ':')
     if not text:
         return None
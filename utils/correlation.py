@@ -8,11 +8,12 @@ signals likely belong to the same physical device.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import sqlite3
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
-from utils.database import add_correlation, get_correlations as db_get_correlations
+from utils.database import add_correlations, get_correlations as db_get_correlations
 
 logger = logging.getLogger('intercept.correlation')
 
@@ -26,6 +27,13 @@ class DeviceObservation:
     rssi: int | None = None
     name: str | None = None
     manufacturer: str | None = None
+    # Normalised match keys, derived once instead of once per device pair
+    oui: str = field(init=False, repr=False, compare=False)
+    manufacturer_key: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.oui = self.mac[:8].upper()
+        self.manufacturer_key = self.manufacturer.lower() if self.manufacturer else None
 
 
 class DeviceCorrelator:
@@ -72,17 +80,23 @@ class DeviceCorrelator:
             List of correlation results with confidence scores
         """
         correlations = []
+        to_persist = []
+
+        # Parse each Bluetooth device once rather than once per WiFi device
+        bt_observations = []
+        for bt_mac, bt_data in bt_devices.items():
+            bt_obs = self._to_observation(bt_mac, bt_data, 'bluetooth')
+            if bt_obs:
+                bt_observations.append((bt_mac, bt_obs))
 
         for wifi_mac, wifi_data in wifi_devices.items():
+            if not bt_observations:
+                break
             wifi_obs = self._to_observation(wifi_mac, wifi_data, 'wifi')
             if not wifi_obs:
                 continue
 
-            for bt_mac, bt_data in bt_devices.items():
-                bt_obs = self._to_observation(bt_mac, bt_data, 'bluetooth')
-                if not bt_obs:
-                    continue
-
+            for bt_mac, bt_obs in bt_observations:
                 confidence = self._calculate_confidence(wifi_obs, bt_obs)
 
                 if confidence >= self.min_confidence:
@@ -95,20 +109,24 @@ class DeviceCorrelator:
                         'reason': self._get_correlation_reason(wifi_obs, bt_obs)
                     })
 
-                    # Persist high-confidence correlations
+                    # Queue high-confidence correlations for persistence
                     if confidence >= 0.7:
-                        try:
-                            add_correlation(
-                                wifi_mac=wifi_mac,
-                                bt_mac=bt_mac,
-                                confidence=confidence,
-                                metadata={
-                                    'wifi_name': wifi_obs.name,
-                                    'bt_name': bt_obs.name
-                                }
-                            )
-                        except Exception as e:
-                            logger.debug(f"Failed to persist correlation: {e}")
+                        to_persist.append({
+                            'wifi_mac': wifi_mac,
+                            'bt_mac': bt_mac,
+                            'confidence': confidence,
+                            'metadata': {
+                                'wifi_name': wifi_obs.name,
+                                'bt_name': bt_obs.name
+                            }
+                        })
+
+        # Persist the whole pass in a single transaction
+        if to_persist:
+            try:
+                add_correlations(to_persist)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to persist {len(to_persist)} correlations: {e}")
 
         # Sort by confidence (highest first)
         correlations.sort(key=lambda x: x['confidence'], reverse=True)
@@ -199,18 +217,16 @@ class DeviceCorrelator:
                 confidence += 0.25  # Partial credit for overlapping presence
 
         # Manufacturer match
-        if wifi.manufacturer and bt.manufacturer:
-            wifi_mfg = wifi.manufacturer.lower()
-            bt_mfg = bt.manufacturer.lower()
+        if wifi.manufacturer_key and bt.manufacturer_key:
+            wifi_mfg = wifi.manufacturer_key
+            bt_mfg = bt.manufacturer_key
             if wifi_mfg == bt_mfg:
                 confidence += 0.2
             elif wifi_mfg[:5] == bt_mfg[:5]:  # Partial match
                 confidence += 0.1
 
         # OUI match (first 3 octets of MAC)
-        wifi_oui = wifi.mac[:8].upper()
-        bt_oui = bt.mac[:8].upper()
-        if wifi_oui == bt_oui:
+        if wifi.oui == bt.oui:
             confidence += 0.15
 
         # RSSI similarity
@@ -238,13 +254,11 @@ class DeviceCorrelator:
         if time_diff <= self.time_window.total_seconds():
             reasons.append(f"appeared within {int(time_diff)}s")
 
-        wifi_oui = wifi.mac[:8].upper()
-        bt_oui = bt.mac[:8].upper()
-        if wifi_oui == bt_oui:
+        if wifi.oui == bt.oui:
             reasons.append("same OUI")
 
-        if wifi.manufacturer and bt.manufacturer:
-            if wifi.manufacturer.lower() == bt.manufacturer.lower():
+        if wifi.manufacturer_key and bt.manufacturer_key:
+            if wifi.manufacturer_key == bt.manufacturer_key:
                 reasons.append(f"same manufacturer ({wifi.manufacturer})")
 
         if wifi.rssi is not None and bt.rssi is not None:
@@ -288,14 +302,12 @@ def get_correlations(
     if include_historical:
         try:
             historical = db_get_correlations(min_confidence)
+            # Avoid duplicates
+            seen_pairs = {(r['wifi_mac'], r['bt_mac']) for r in results}
             for h in historical:
-                # Avoid duplicates
-                existing = next(
-                    (r for r in results
-                     if r['wifi_mac'] == h['wifi_mac'] and r['bt_mac'] == h['bt_mac']),
-                    None
-                )
-                if not existing:
+                pair = (h['wifi_mac'], h['bt_mac'])
+                if pair not in seen_pairs:
+                    seen_pairs.add(pair)
                     results.append({
                         'wifi_mac': h['wifi_mac'],
                         'bt_mac': h['bt_mac'],
@@ -88,6 +88,12 @@ def init_db() -> None:
             ON signal_history(mode, device_id, timestamp)
         ''')
 
+        # Age-based cleanup filters on timestamp alone
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_signal_history_timestamp
+            ON signal_history(timestamp)
+        ''')
+
         # Device correlation table
         conn.execute('''
             CREATE TABLE IF NOT EXISTS device_correlations (
@@ -148,6 +154,22 @@ def init_db() -> None:
             )
         ''')
 
+        # Indexes for correlation, alert and recording listings
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_device_correlations_confidence
+            ON device_correlations(confidence)
+        ''')
+
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_alert_events_mode_severity
+            ON alert_events(mode, severity)
+        ''')
+
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_recording_sessions_started
+            ON recording_sessions(started_at)
+        ''')
+
         # Alert rules
         conn.execute('''
             CREATE TABLE IF NOT EXISTS alert_rules (
@@ -531,6 +553,11 @@ def init_db() -> None:
             ON push_payloads(agent_id, received_at)
         ''')
 
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_push_payloads_received
+            ON push_payloads(received_at)
+        ''')
+
         # Tracked satellites table for persistent satellite management
         conn.execute('''
             CREATE TABLE IF NOT EXISTS tracked_satellites (
@@ -590,22 +617,51 @@ def get_setting(key: str, default: Any = None) -> Any:
         if row is None:
             return default
 
-        value, value_type = row['value'], row['value_type']
+        return _decode_setting(row['value'], row['value_type'], default)
 
-        # Convert based on type
-        if value_type == 'json':
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                return default
-        elif value_type == 'int':
-            return int(value)
-        elif value_type == 'float':
-            return float(value)
-        elif value_type == 'bool':
-            return value.lower() in ('true', '1', 'yes')
-        else:
-            return value
+
+def get_settings(defaults: dict[str, Any]) -> dict[str, Any]:
+    """
+    Get several settings in a single query.
+
+    Args:
+        defaults: Mapping of setting key to the value returned when unset
+
+    Returns:
+        Dict with an entry for every key in defaults
+    """
+    settings = dict(defaults)
+    if not settings:
+        return settings
+
+    placeholders = ','.join('?' * len(settings))
+    with get_db() as conn:
+        cursor = conn.execute(
+            f'SELECT key, value, value_type FROM settings WHERE key IN ({placeholders})',
+            tuple(settings)
+        )
+        for row in cursor:
+            key = row['key']
+            settings[key] = _decode_setting(row['value'], row['value_type'], defaults[key])
+
+    return settings
+
+
+def _decode_setting(value: str, value_type: str, default: Any) -> Any:
+    """Convert a stored setting string back to its Python type."""
+    if value_type == 'json':
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return default
+    elif value_type == 'int':
+        return int(value)
+    elif value_type == 'float':
+        return float(value)
+    elif value_type == 'bool':
+        return value.lower() in ('true', '1', 'yes')
+    else:
+        return value
 
 
 def set_setting(key: str, value: Any) -> None:
@@ -771,15 +827,41 @@ def add_correlation(
     metadata: dict | None = None
 ) -> None:
     """Add or update a device correlation."""
+    add_correlations([{
+        'wifi_mac': wifi_mac,
+        'bt_mac': bt_mac,
+        'confidence': confidence,
+        'metadata': metadata,
+    }])
+
+
+def add_correlations(correlations: list[dict]) -> None:
+    """
+    Add or update several device correlations in one transaction.
+
+    Each entry needs 'wifi_mac', 'bt_mac' and 'confidence' keys and may
+    carry an optional 'metadata' dict.
+    """
+    if not correlations:
+        return
+
     with get_db() as conn:
-        conn.execute('''
+        conn.executemany('''
             INSERT INTO device_correlations (wifi_mac, bt_mac, confidence, metadata, last_seen)
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
             ON CONFLICT(wifi_mac, bt_mac) DO UPDATE SET
                 confidence = excluded.confidence,
                 last_seen = CURRENT_TIMESTAMP,
                 metadata = excluded.metadata
-        ''', (wifi_mac, bt_mac, confidence, json.dumps(metadata) if metadata else None))
+        ''', [
+            (
+                c['wifi_mac'],
+                c['bt_mac'],
+                c['confidence'],
+                json.dumps(c['metadata']) if c.get('metadata') else None,
+            )
+            for c in correlations
+        ])
 
 
 def get_correlations(min_confidence: float = 0.5) -> list[dict]:
@@ -216,7 +216,8 @@ _recording_lock = threading.Lock()
 
 def get_recording_manager() -> RecordingManager:
     global _recording_manager
-    with _recording_lock:
-        if _recording_manager is None:
-            _recording_manager = RecordingManager()
-        return _recording_manager
+    if _recording_manager is None:
+        with _recording_lock:
+            if _recording_manager is None:
+                _recording_manager = RecordingManager()
+    return _recording_manager
@@ -6,6 +6,7 @@ import json
 import queue
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Callable, Generator
 
@@ -16,6 +17,9 @@ class _QueueFanoutChannel:
     source_queue: queue.Queue
     source_timeout: float
     subscribers: set[queue.Queue] = field(default_factory=set)
+    # Immutable copy of subscribers, republished under lock on membership
+    # changes so the distributor can read it without locking per message.
+    snapshot: tuple[queue.Queue, ...] = ()
     lock: threading.Lock = field(default_factory=threading.Lock)
     distributor: threading.Thread | None = None
 
@@ -27,10 +31,7 @@ _fanout_channels_lock = threading.Lock()
 def _run_fanout(channel: _QueueFanoutChannel) -> None:
     """Drain source queue and fan out each message to all subscribers."""
     while True:
-        with channel.lock:
-            has_subscribers = bool(channel.subscribers)
-
-        if not has_subscribers:
+        if not channel.snapshot:
             # Do not drain source_queue when no clients are connected.
             time.sleep(channel.source_timeout)
             continue
@@ -40,9 +41,7 @@ def _run_fanout(channel: _QueueFanoutChannel) -> None:
         except queue.Empty:
             continue
 
-        with channel.lock:
-            subscribers = tuple(channel.subscribers)
-
+        subscribers = channel.snapshot
         if not subscribers:
             # Subscriber set changed after we dequeued; requeue best-effort.
             try:
@@ -113,6 +112,7 @@ def subscribe_fanout_queue(
 
     with channel.lock:
         channel.subscribers.add(subscriber)
+        channel.snapshot = tuple(channel.subscribers)
 
     # Start distributor only after subscriber is registered to avoid initial-loss race.
     _ensure_distributor_running(channel, channel_key)
@@ -120,10 +120,85 @@ def subscribe_fanout_queue(
     def _unsubscribe() -> None:
         with channel.lock:
             channel.subscribers.discard(subscriber)
+            channel.snapshot = tuple(channel.subscribers)
 
     return subscriber, _unsubscribe
 
 
+class FanoutSubscriber:
+    """Per-client frame buffer for a route-owned SSE broadcast.
+
+    The deque is bounded, so a slow client silently loses its oldest frames
+    instead of making the broadcaster catch Full and evict by hand.
+    """
+
+    __slots__ = ('frames', 'ready')
+
+    def __init__(self, maxlen: int) -> None:
+        self.frames: deque = deque(maxlen=maxlen)
+        self.ready = threading.Event()
+
+    def is_full(self) -> bool:
+        """Whether the buffer is at capacity, so the next push evicts a frame."""
+        return len(self.frames) >= self.frames.maxlen
+
+    def push(self, frame: Any) -> None:
+        """Buffer a frame and wake the client's stream generator."""
+        self.frames.append(frame)
+        self.ready.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until frames are pushed or timeout expires; True if woken by a push."""
+        if not self.ready.wait(timeout=timeout):
+            return False
+        # Re-arm before the caller drains, so a push that lands mid-drain is not missed
+        self.ready.clear()
+        return True
+
+    def drain(self) -> Generator[Any, None, None]:
+        """Pop and yield every buffered frame, oldest first."""
+        frames = self.frames
+        while frames:
+            yield frames.popleft()
+
+
+class FanoutSubscriberSet:
+    """Registry of FanoutSubscriber clients for one broadcast stream.
+
+    Membership changes take a lock and republish an immutable snapshot tuple,
+    so publishing reads the snapshot without locking.
+    """
+
+    def __init__(self, client_buffer_size: int = 500) -> None:
+        self.client_buffer_size = client_buffer_size
+        self.snapshot: tuple[FanoutSubscriber, ...] = ()
+        self._members: set[FanoutSubscriber] = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> FanoutSubscriber:
+        """Register and return a new client buffer."""
+        subscriber = FanoutSubscriber(self.client_buffer_size)
+        with self._lock:
+            self._members.add(subscriber)
+            self.snapshot = tuple(self._members)
+        return subscriber
+
+    def unsubscribe(self, subscriber: FanoutSubscriber) -> None:
+        """Remove a client buffer; unknown subscribers are ignored."""
+        with self._lock:
+            self._members.discard(subscriber)
+            self.snapshot = tuple(self._members)
+
+    def publish(self, frame: Any) -> None:
+        """Push a frame to every subscribed client."""
+        for subscriber in self.snapshot:
+            subscriber.push(frame)
+
+    def pending(self) -> int:
+        """Best-effort count of frames buffered across all clients."""
+        return sum(len(subscriber.frames) for subscriber in self.snapshot)
+
+
 def sse_stream_fanout(
     source_queue: queue.Queue,
     channel_key: str,
@@ -140,7 +215,7 @@ def sse_stream_fanout(
         channel_key=channel_key,
         source_timeout=timeout,
     )
-    last_keepalive = time.time()
+    last_keepalive = time.monotonic()
 
     try:
         while True:
@@ -149,7 +224,7 @@ def sse_stream_fanout(
 
             try:
                 msg = subscriber.get(timeout=timeout)
-                last_keepalive = time.time()
+                last_keepalive = time.monotonic()
                 if on_message and isinstance(msg, dict):
                     try:
                         on_message(msg)
@@ -157,7 +232,7 @@ def sse_stream_fanout(
                         pass
                 yield format_sse(msg)
             except queue.Empty:
-                now = time.time()
+                now = time.monotonic()
                 if now - last_keepalive >= keepalive_interval:
                     yield format_sse({'type': 'keepalive'})
                     last_keepalive = now
@@ -209,14 +284,11 @@ def format_sse(data: dict[str, Any] | str, event: str | None = None) -> str:
     if isinstance(data, dict):
         data = json.dumps(data)
 
-    lines = []
+    # Called once per streamed frame; build the frame in a single format
+    # instead of assembling and joining a list.
     if event:
-        lines.append(f"event: {event}")
-    lines.append(f"data: {data}")
-    lines.append("")
-    lines.append("")
-
-    return '\n'.join(lines)
+        return f"event: {event}\ndata: {data}\n\n"
+    return f"data: {data}\n\n"
 
 
 def clear_queue(q: queue.Queue) -> int:
@@ -15,6 +15,13 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
 from datetime import datetime, timezone
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger('intercept.trilateration')
 
 
@@ -298,6 +305,15 @@ class Trilateration:
         initial_lat = sum(obs.agent_lat * w for obs, w in zip(valid_obs, weights)) / total_weight
         initial_lon = sum(obs.agent_lon * w for obs, w in zip(valid_obs, weights)) / total_weight
 
+        # Prefer the closed-form least squares solution when it fits the
+        # measured ranges better than the centroid
+        seed = self._least_squares_seed(valid_obs, distances)
+        if seed is not None and (
+            self._sum_squared_error(seed[0], seed[1], valid_obs, distances)
+            < self._sum_squared_error(initial_lat, initial_lon, valid_obs, distances)
+        ):
+            initial_lat, initial_lon = seed
+
         # Iterative refinement using gradient descent
         current_lat, current_lon = initial_lat, initial_lon
 
@@ -380,6 +396,60 @@ class Trilateration:
             method="multilateration"
         )
 
+    @staticmethod
+    def _least_squares_seed(
+        observations: List[AgentObservation],
+        distances: List[float]
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Solve the linearized range equations in one least squares step.
+
+        Observer positions are projected onto a local plane in meters around
+        the last observer, and each range equation is differenced against it
+        so that the system becomes linear: 2(p_i - p_n) . x = d_n^2 - d_i^2 + |p_i|^2.
+
+        Returns:
+            (lat, lon) tuple, or None if numpy is unavailable or the
+            observers are too few or collinear to fix a 2D position
+        """
+        if not NUMPY_AVAILABLE or len(observations) < 3:
+            return None
+
+        ref_lat = observations[-1].agent_lat
+        ref_lon = observations[-1].agent_lon
+        lon_scale = 111000.0 * math.cos(math.radians(ref_lat))
+
+        anchors = np.array(
+            [((obs.agent_lon - ref_lon) * lon_scale, (obs.agent_lat - ref_lat) * 111000.0)
+             for obs in observations],
+            dtype=np.float64,
+        )
+        dists = np.asarray(distances, dtype=np.float64)
+
+        # Reference anchor sits at the origin, so its |p_n|^2 term vanishes
+        a = 2.0 * anchors[:-1]
+        b = dists[-1] ** 2 - np.square(dists[:-1]) + np.einsum('ij,ij->i', anchors[:-1], anchors[:-1])
+
+        solution, _, rank, _ = np.linalg.lstsq(a, b, rcond=None)
+        if rank < 2 or not np.all(np.isfinite(solution)):
+            return None
+
+        east, north = float(solution[0]), float(solution[1])
+        return offset_position(ref_lat, ref_lon, north, east)
+
+    @staticmethod
+    def _sum_squared_error(
+        lat: float,
+        lon: float,
+        observations: List[AgentObservation],
+        distances: List[float]
+    ) -> float:
+        """Sum of squared range errors for a candidate position."""
+        return sum(
+            (haversine_distance(lat, lon, obs.agent_lat, obs.agent_lon) - dist) ** 2
+            for obs, dist in zip(observations, distances)
+        )
+
 
 # =============================================================================
 # Device Location Tracker